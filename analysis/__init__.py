@@ -0,0 +1,17 @@
+from ._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "AnalysisStatistics": ".statistics",
+    "ArrayFileManager": ".utils",
+    "ExecutionResources": ".utils",
+    "Filter": ".filters",
+    "LS": ".filters",
+    "MonteCarloCases": ".cases",
+    "OF2": ".filters",
+    "SetupDataset": ".datasets",
+    "StudyCases": ".cases"
+}
+
+__all__ = ["AnalysisStatistics", "ArrayFileManager", "ExecutionResources", "Filter", "LS", "MonteCarloCases", "OF2", "SetupDataset", "StudyCases"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
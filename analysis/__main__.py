@@ -1,43 +1,49 @@
 import argparse
 
-import numpy as np
-
-from cases.study_cases import StudyCases
-from utils.array_file_manager import ArrayFileManager
-
-def calculate_results(data_path, occupancy, slice_size):
-    if np.mod(slice_size, 2) != 0:
-        # Loading data
-        filename = f"training_occupancy_{occupancy}.csv"
-        training_dataset = ArrayFileManager.read_array_from_file(data_path, filename)
-
-        filename = f"test_occupancy_{occupancy}.csv"
-        test_dataset = ArrayFileManager.read_array_from_file(data_path, filename)
-
-        # Retrieving data size
-        data_size, _ = np.shape(training_dataset)
-
-        # Discarding edge data and calculating the number of slices
-        discard_size = np.mod(data_size, slice_size)
-        if discard_size == 0:
-            n_slices = data_size // slice_size
-        else:
-            n_slices = (data_size - discard_size) // slice_size
-            training_dataset = training_dataset[:-discard_size, :]
-            test_dataset = test_dataset[:-discard_size, :]
-
-        # Running analysis
-        analysis_cases = StudyCases(training_dataset, test_dataset, n_slices, slice_size, occupancy)
-        analysis_cases.run_case_1(save_file=True, plot_results=True)
-    else:
-        raise ValueError("Slice size must be an odd number.")
+from .runner import calculate_all_results, run_monte_carlo
+from .utils.execution_resources import ExecutionResources
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
 
     parser.add_argument("--data_path", required=False, type=str, help="Calorimetry pulse data relative path (default: data/)")
-    parser.add_argument("--occupancy", required=True, type=float, help="Occupancy (0.1 | 0.3 | 0.5)")
-    parser.add_argument("--slice_size", required=True, type=int, help="Slice size (integer greater than zero)")
-    
+    parser.add_argument("--occupancy", required=False, type=float, nargs="+", help="Occupancy (0.1 | 0.3 | 0.5), one or more")
+    parser.add_argument("--slice_size", required=True, type=int, nargs="+", help="Slice size (integer greater than zero), one or more")
+    parser.add_argument("--workers", required=False, type=int, help="Number of worker processes (default: derived from --blas_threads, or one per core)")
+    parser.add_argument("--blas_threads", required=False, type=int, help="Number of BLAS threads per worker (default: derived from --workers, or 1)")
+    parser.add_argument("--calibrate", required=False, type=int, metavar="DATA_SIZE",
+                        help="Measure the fastest workers/BLAS threads split for each slice size and the given data size, then exit")
+    parser.add_argument("--monte_carlo", required=False, type=int, metavar="N_REALIZATIONS",
+                        help="Train the LS/OF2 weights once and report their error statistics over freshly generated test realizations")
+    parser.add_argument("--n_slices", required=False, type=int, help="Number of slices of each generated dataset (required by --monte_carlo)")
+    parser.add_argument("--seed", required=False, type=int, help="Base seed of the --monte_carlo realizations (default: drawn from the operating system)")
+
     args = parser.parse_args()
-    calculate_results(args.data_path, args.occupancy, args.slice_size)
\ No newline at end of file
+
+    try:
+        resources = ExecutionResources(args.workers, args.blas_threads)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.calibrate is not None:
+        if args.workers is not None or args.blas_threads is not None:
+            parser.error("--calibrate measures every split and cannot be combined with --workers or --blas_threads")
+        for slice_size in args.slice_size:
+            try:
+                best, timings = ExecutionResources.calibrate(slice_size, args.calibrate)
+            except ValueError as e:
+                parser.error(str(e))
+            for (n_workers, blas_threads), elapsed in timings.items():
+                print(f"slice_size={slice_size} workers={n_workers} blas_threads={blas_threads}: {elapsed:.4f} s")
+            print(f"Best split for slice_size={slice_size}: --workers {best.n_workers} --blas_threads {best.blas_threads}")
+    elif args.occupancy is None:
+        parser.error("the following arguments are required: --occupancy")
+    elif args.monte_carlo is not None:
+        if args.n_slices is None:
+            parser.error("the following arguments are required by --monte_carlo: --n_slices")
+        try:
+            run_monte_carlo(args.occupancy, args.slice_size, args.n_slices, args.monte_carlo, resources, args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        calculate_all_results(args.data_path, args.occupancy, args.slice_size, resources)
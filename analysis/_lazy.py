@@ -0,0 +1,38 @@
+import importlib
+
+def attach_lazy_attrs(module_name, lazy_attrs):
+    """
+    Builds the module-level __getattr__ and __dir__ functions that import public names on first access.
+
+    Every package of analysis declares its public names in a _LAZY_ATTRS dict, mapping each name to
+    the submodule defining it, lists the same names in __all__, and ends with
+
+    __getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
+
+    so that importing a package does not load NumPy, pycps or any submodule until a name is used.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the package exposing the names (its __name__).
+    lazy_attrs : dict
+        A mapping from each public name to the relative name of the submodule defining it.
+
+    Returns
+    -------
+    Tuple[function, function]
+        The __getattr__ and __dir__ functions of the package.
+    """
+    module_globals = vars(importlib.import_module(module_name))
+
+    def __getattr__(name):
+        if name in lazy_attrs:
+            value = getattr(importlib.import_module(lazy_attrs[name], module_name), name)
+            module_globals[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(module_globals) | set(lazy_attrs))
+
+    return (__getattr__, __dir__)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Commands timed by the benchmark, from the bare interpreter to a full CLI parse
+STARTUP_COMMANDS = {
+    "interpreter": ["-c", "pass"],
+    "import analysis": ["-c", "import analysis"],
+    "import analysis.LS": ["-c", "from analysis import LS"],
+    "python -m analysis --help": ["-m", "analysis", "--help"],
+}
+
+def time_command(args, n_runs):
+    """
+    Runs a Python command in fresh interpreters and measures the wall time of each run.
+
+    Parameters
+    ----------
+    args : list of str
+        The interpreter arguments.
+    n_runs : int
+        The number of runs.
+
+    Returns
+    -------
+    list of float
+        The elapsed time in seconds of each run.
+    """
+    # Running from the parent directory, where the package is importable as "analysis"
+    cwd = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    elapsed = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed.append(time.perf_counter() - start)
+
+    return elapsed
+
+def run_benchmark(n_runs):
+    """
+    Measures the startup time of every command in STARTUP_COMMANDS and prints a summary.
+
+    Parameters
+    ----------
+    n_runs : int
+        The number of runs per command.
+
+    Returns
+    -------
+    dict
+        The minimum and median elapsed time in seconds of each command.
+    """
+    results = {}
+    for name, args in STARTUP_COMMANDS.items():
+        elapsed = time_command(args, n_runs)
+        results[name] = (min(elapsed), statistics.median(elapsed))
+        print(f"{name:<28} min {results[name][0] * 1e3:8.1f} ms   median {results[name][1] * 1e3:8.1f} ms")
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--runs", required=False, type=int, default=20, help="Number of runs per command (default: 20)")
+
+    args = parser.parse_args()
+    run_benchmark(args.runs)
\ No newline at end of file
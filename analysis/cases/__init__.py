@@ -1 +1,10 @@
-from .study_cases import StudyCases
\ No newline at end of file
+from .._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "MonteCarloCases": ".monte_carlo",
+    "StudyCases": ".study_cases"
+}
+
+__all__ = ["MonteCarloCases", "StudyCases"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
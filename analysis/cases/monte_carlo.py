@@ -0,0 +1,261 @@
+import numpy as np
+
+from ..datasets.setup_dataset import SetupDataset
+from ..filters.least_squares import LS
+from ..filters.of2 import OF2
+from ..statistics.analysis_statistics import AnalysisStatistics
+from ..utils.execution_resources import ExecutionResources
+
+class MonteCarloCases:
+    """
+    A class to assess the robustness of the estimators over many independent noise realizations.
+
+    The LS and OF2 weights are trained once; each realization then generates a fresh test dataset
+    in memory, estimates its amplitudes and keeps only the statistics of the errors, so nothing
+    is written to disk per realization.
+
+    Parameters
+    ----------
+    pulse_shape_path : str
+        Path to the reference pulse shape file (time in ns, normalized amplitude).
+    n_slices : int
+        The number of slices in each dataset.
+    slice_size : int
+        The size of each slice in the datasets.
+    occupancy : float
+        The occupancy of the datasets.
+    seed : int or None
+        The base seed; the training dataset and every test realization get their own seed derived
+        from it. If None, the base seed is drawn from the operating system.
+
+    Methods
+    -------
+    train()
+        Trains the LS weights on a generated dataset and computes the OF2 weights from the pulse shape.
+    run(n_realizations, resources)
+        Runs the estimators over freshly generated test realizations and returns their error statistics.
+    check_n_realizations(n_realizations)
+        Checks that at least one realization is requested.
+    summarize(error_statistics)
+        Aggregates the per-realization error statistics of each estimator.
+    """
+
+    def __init__(self, pulse_shape_path, n_slices, slice_size, occupancy, seed=None) -> None:
+        if slice_size % 2 == 0:
+            raise ValueError("Slice size must be an odd number.")
+        if n_slices < slice_size:
+            # Fewer slices than filter coefficients make the LS problem rank deficient
+            raise ValueError(f"Number of slices must be at least the slice size ({slice_size}), but got {n_slices}")
+
+        self.pulse_shape_path = pulse_shape_path
+        self.n_slices = n_slices
+        self.slice_size = slice_size
+        self.occupancy = occupancy
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+        self.weights = {}
+
+    def train(self):
+        """
+        Trains the LS weights on a generated dataset and computes the OF2 weights from the pulse shape.
+        Estimators without a feasible solution are left out of the analysis.
+
+        Returns
+        -------
+        dict
+            The weights of each estimator with a feasible solution, keyed by estimator name.
+        """
+        self.weights = {}
+
+        # Least squares, trained on the central amplitude of each window
+        training_seed, = self.seed_sequence.spawn(1)
+        samples, amplitudes = _generate_realization(self.pulse_shape_path, self.n_slices,
+                                                    self.slice_size, self.occupancy, training_seed)
+        weights, success = LS(samples, amplitudes[:, self.slice_size//2], self.slice_size).go_filtering()
+        if success:
+            self.weights["LS"] = weights
+        else:
+            print("Least squares could not find a feasible solution.")
+
+        # OF2, built from the pulse shape and its derivative at the sampling instants
+        t_filter, g, dg = self.__sample_pulse_shape()
+        weights, success = OF2(self.slice_size, t_filter, g, dg).go_filtering()
+        if success:
+            self.weights["OF2"] = weights
+        else:
+            print("OF2 could not find a feasible solution.")
+
+        return self.weights
+
+    def run(self, n_realizations, resources=None):
+        """
+        Runs the estimators over freshly generated test realizations and returns their error statistics.
+
+        Parameters
+        ----------
+        n_realizations : int
+            The number of independent test realizations.
+        resources : ExecutionResources or None
+            The split of cores between workers and BLAS threads (default: one worker per core).
+
+        Returns
+        -------
+        dict
+            For each estimator, an array of shape (n_realizations, 2) with the mean and the standard
+            deviation of the amplitude errors of each realization.
+
+        Raises
+        ------
+        ValueError
+            If fewer than one realization is requested.
+        RuntimeError
+            If no estimator has been trained.
+        """
+        self.check_n_realizations(n_realizations)
+        if not self.weights:
+            raise RuntimeError("No trained estimator; call train() first.")
+
+        resources = resources if resources is not None else ExecutionResources()
+        resources = resources.for_jobs(n_realizations)
+
+        # Independent, reproducible streams: one child seed per realization
+        jobs = [(self.pulse_shape_path, self.n_slices, self.slice_size, self.occupancy, self.weights, seed)
+                for seed in self.seed_sequence.spawn(n_realizations)]
+
+        if resources.n_workers > 1:
+            with resources.applied(), resources.get_pool() as pool:
+                realizations = pool.starmap(_run_realization, jobs)
+        else:
+            realizations = [_run_realization(*job) for job in jobs]
+
+        return {name: np.array([realization[name] for realization in realizations]) for name in self.weights}
+
+    @staticmethod
+    def check_n_realizations(n_realizations):
+        """
+        Checks that at least one realization is requested.
+
+        Parameters
+        ----------
+        n_realizations : int
+            The number of test realizations.
+
+        Raises
+        ------
+        ValueError
+            If n_realizations is smaller than one.
+        """
+        if n_realizations < 1:
+            raise ValueError(f"Expected at least 1 realization, but got {n_realizations}")
+
+    @staticmethod
+    def summarize(error_statistics):
+        """
+        Aggregates the per-realization error statistics of each estimator.
+
+        Parameters
+        ----------
+        error_statistics : dict
+            The output of run().
+
+        Returns
+        -------
+        dict
+            For each estimator, the mean and the standard deviation across realizations of the
+            per-realization error mean and error standard deviation.
+        """
+        summary = {}
+        for name, statistics in error_statistics.items():
+            summary[name] = {
+                "mean_error": (np.mean(statistics[:, 0]), np.std(statistics[:, 0])),
+                "std_error": (np.mean(statistics[:, 1]), np.std(statistics[:, 1])),
+            }
+
+        return summary
+
+    def __sample_pulse_shape(self):
+        """
+        Samples the reference pulse shape and its derivative at the instants of a window centered on the peak.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            A tuple of sampling instants, pulse shape and pulse shape derivative arrays.
+        """
+        times, shape = np.loadtxt(self.pulse_shape_path, unpack=True)
+        derivative = np.gradient(shape, times)
+
+        # The generator's sampling rate is the spacing between samples, in ns
+        t_filter = (np.arange(self.slice_size) - self.slice_size//2) * SetupDataset.SAMPLING_RATE
+        g = np.interp(t_filter, times, shape)
+        dg = np.interp(t_filter, times, derivative)
+
+        return (t_filter, g, dg)
+
+def _generate_realization(pulse_shape_path, n_slices, slice_size, occupancy, seed_sequence):
+    """
+    Generates a sliced dataset in memory.
+
+    Parameters
+    ----------
+    pulse_shape_path : str
+        Path to the reference pulse shape file.
+    n_slices : int
+        The number of slices in the dataset.
+    slice_size : int
+        The size of each slice in the dataset.
+    occupancy : float
+        The occupancy of the dataset.
+    seed_sequence : numpy.random.SeedSequence
+        The seed sequence of this dataset, used to seed the generators.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        A tuple of samples and amplitudes arrays of shape (n_slices, slice_size).
+    """
+    from pycps import TextFilePulseShape
+
+    # Independent words for the pulse and the noise streams
+    pulse_seed, noise_seed = (int(word) for word in seed_sequence.generate_state(2))
+    dataset = SetupDataset(TextFilePulseShape(pulse_shape_path), n_slices, slice_size, pulse_seed, noise_seed)
+    dataset.create_sliced_dataset(occupancy)
+
+    samples = np.reshape(dataset.get_dataset_samples(), (n_slices, slice_size))
+    amplitudes = np.reshape(dataset.get_dataset_amplitudes(), (n_slices, slice_size))
+
+    return (samples, amplitudes)
+
+def _run_realization(pulse_shape_path, n_slices, slice_size, occupancy, weights, seed_sequence):
+    """
+    Generates one test realization and computes the error statistics of each estimator on it.
+
+    Parameters
+    ----------
+    pulse_shape_path : str
+        Path to the reference pulse shape file.
+    n_slices : int
+        The number of slices in the dataset.
+    slice_size : int
+        The size of each slice in the dataset.
+    occupancy : float
+        The occupancy of the dataset.
+    weights : dict
+        The weights of each estimator, keyed by estimator name.
+    seed_sequence : numpy.random.SeedSequence
+        The seed sequence of this realization.
+
+    Returns
+    -------
+    dict
+        The mean and the standard deviation of the amplitude errors, keyed by estimator name.
+    """
+    samples, amplitudes = _generate_realization(pulse_shape_path, n_slices, slice_size, occupancy, seed_sequence)
+
+    statistics = {}
+    for name, estimator_weights in weights.items():
+        estimated_amplitudes = AnalysisStatistics.estimate_amplitudes(samples, estimator_weights, n_slices, slice_size)
+        error_amplitudes = AnalysisStatistics.compare_amplitudes(amplitudes, n_slices, slice_size, estimated_amplitudes)
+        statistics[name] = (np.mean(error_amplitudes), np.std(error_amplitudes))
+
+    return statistics
\ No newline at end of file
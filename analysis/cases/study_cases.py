@@ -1,7 +1,7 @@
 import numpy as np
-from filters.least_squares import LS
-from statistics.analysis_statistics import AnalysisStatistics
-from utils.array_file_manager import ArrayFileManager
+from ..filters.least_squares import LS
+from ..statistics.analysis_statistics import AnalysisStatistics
+from ..utils.array_file_manager import ArrayFileManager
 
 class StudyCases:
     """
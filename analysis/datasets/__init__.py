@@ -1 +1,9 @@
-from .setup_dataset import SetupDataset
\ No newline at end of file
+from .._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "SetupDataset": ".setup_dataset"
+}
+
+__all__ = ["SetupDataset"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
@@ -1,4 +1,3 @@
-from pycps import PulseGenerator, DatasetGenerator
 import numpy as np
 
 class SetupDataset:
@@ -13,6 +12,10 @@ class SetupDataset:
         The number of slices in the dataset.
     slice_size : int
         Window size.
+    pulse_seed : int or None
+        Seed of the pulse generator. If None, the generator keeps its own seeding.
+    noise_seed : int or None
+        Seed of the dataset generator. If None, the generator keeps its own seeding.
     _pulse_generator : PulseGenerator or None
         The pulse generator object used to create the pulses.
     _dataset_generator : DatasetGenerator or None
@@ -43,7 +46,10 @@ class SetupDataset:
         and occupancy.
 
     """
-    def __init__(self, pulse_shape, n_slices, slice_size):
+    # Sampling rate passed to the dataset generator
+    SAMPLING_RATE = 25.0
+
+    def __init__(self, pulse_shape, n_slices, slice_size, pulse_seed=None, noise_seed=None):
         """
         Parameters
         ----------
@@ -53,10 +59,16 @@ class SetupDataset:
             The number of slices in the dataset.
         slice_size : int
             Window size
+        pulse_seed : int or None
+            Seed of the pulse generator (default: None, unseeded)
+        noise_seed : int or None
+            Seed of the dataset generator (default: None, unseeded)
         """
         self.pulse_shape = pulse_shape
         self.n_slices = n_slices
         self.slice_size = slice_size
+        self.pulse_seed = pulse_seed
+        self.noise_seed = noise_seed
 
         self._pulse_generator = None
         self._dataset_generator = None
@@ -67,6 +79,9 @@ class SetupDataset:
         Initializes the pulse generator object with the pulse shape and sets the amplitude and phase distributions,
         deformation level, and pedestal.
         """
+        # pycps is only needed to generate datasets, so it is not required to import this module
+        from pycps import PulseGenerator
+
         self._pulse_generator = PulseGenerator(self.pulse_shape)
         self._pulse_generator.set_amplitude_distribution(
             PulseGenerator.UNIFORM_REAL_DISTRIBUTION, [0, 1023])
@@ -74,6 +89,8 @@ class SetupDataset:
             PulseGenerator.UNIFORM_INT_DISTRIBUTION, [-5, 5])
         self._pulse_generator.set_deformation_level(0.01)
         self._pulse_generator.set_pedestal(0.0)
+        if self.pulse_seed is not None:
+            self._pulse_generator.set_seed(self.pulse_seed)
 
     def _setup_dataset_generator(self, occupancy):
         """
@@ -85,11 +102,15 @@ class SetupDataset:
         occupancy : float
             The occupancy of the pulses in the dataset.
         """
+        from pycps import DatasetGenerator
+
         self._dataset_generator = DatasetGenerator()
         self._dataset_generator.set_pulse_generator(self._pulse_generator)
-        self._dataset_generator.set_sampling_rate(25.0)
+        self._dataset_generator.set_sampling_rate(self.SAMPLING_RATE)
         self._dataset_generator.set_noise_params(0.0, 1.5)
         self._dataset_generator.set_occupancy(occupancy)
+        if self.noise_seed is not None:
+            self._dataset_generator.set_seed(self.noise_seed)
 
     def create_sliced_dataset(self, occupancy):
         """
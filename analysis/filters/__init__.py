@@ -1 +1,11 @@
-from .least_squares import LS
\ No newline at end of file
+from .._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "Filter": ".filter",
+    "LS": ".least_squares",
+    "OF2": ".of2"
+}
+
+__all__ = ["Filter", "LS", "OF2"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
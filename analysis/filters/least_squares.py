@@ -1,4 +1,4 @@
-from filters.filter import Filter
+from .filter import Filter
 
 import numpy as np
 from numpy.linalg import inv
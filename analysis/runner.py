@@ -0,0 +1,77 @@
+import itertools
+import os
+
+PULSE_SHAPE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "base", "unipolar-pulse-shape.dat")
+
+def calculate_results(data_path, occupancy, slice_size):
+    # NumPy is imported here, after the BLAS thread limits have been applied
+    import numpy as np
+
+    from .cases.study_cases import StudyCases
+    from .utils.array_file_manager import ArrayFileManager
+
+    if np.mod(slice_size, 2) != 0:
+        # Loading data
+        filename = f"training_occupancy_{occupancy}.csv"
+        training_dataset = ArrayFileManager.read_array_from_file(data_path, filename)
+
+        filename = f"test_occupancy_{occupancy}.csv"
+        test_dataset = ArrayFileManager.read_array_from_file(data_path, filename)
+
+        # Retrieving data size
+        data_size, _ = np.shape(training_dataset)
+
+        # Discarding edge data and calculating the number of slices
+        discard_size = np.mod(data_size, slice_size)
+        if discard_size == 0:
+            n_slices = data_size // slice_size
+        else:
+            n_slices = (data_size - discard_size) // slice_size
+            training_dataset = training_dataset[:-discard_size, :]
+            test_dataset = test_dataset[:-discard_size, :]
+
+        # Running analysis
+        analysis_cases = StudyCases(training_dataset, test_dataset, n_slices, slice_size, occupancy)
+        analysis_cases.run_case_1(save_file=True, plot_results=True)
+    else:
+        raise ValueError("Slice size must be an odd number.")
+
+def calculate_all_results(data_path, occupancies, slice_sizes, resources):
+    jobs = [(data_path, occupancy, slice_size) for occupancy, slice_size in itertools.product(occupancies, slice_sizes)]
+
+    # Applying the thread limits before any process loads NumPy
+    resources = resources.for_jobs(len(jobs))
+    with resources.applied():
+        if resources.n_workers > 1:
+            with resources.get_pool() as pool:
+                pool.starmap(calculate_results, jobs)
+        else:
+            for job in jobs:
+                calculate_results(*job)
+
+def run_monte_carlo(occupancies, slice_sizes, n_slices, n_realizations, resources, seed=None):
+    # The thread limits are applied by MonteCarloCases.run, so training uses the full BLAS pool
+    import numpy as np
+
+    from .cases.monte_carlo import MonteCarloCases
+
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+
+    # Validating every case before any training starts
+    MonteCarloCases.check_n_realizations(n_realizations)
+    cases = [MonteCarloCases(PULSE_SHAPE_PATH, n_slices, slice_size, occupancy, seed)
+             for occupancy, slice_size in itertools.product(occupancies, slice_sizes)]
+
+    print(f"Base seed: {seed}")
+
+    for monte_carlo in cases:
+        occupancy, slice_size = monte_carlo.occupancy, monte_carlo.slice_size
+        monte_carlo.train()
+        summary = MonteCarloCases.summarize(monte_carlo.run(n_realizations, resources))
+
+        for name, statistics in summary.items():
+            mean_error, std_error = statistics["mean_error"], statistics["std_error"]
+            print(f"occupancy={occupancy} slice_size={slice_size} {name}: "
+                  f"error mean {mean_error[0]:.4f} +/- {mean_error[1]:.4f}, "
+                  f"error std {std_error[0]:.4f} +/- {std_error[1]:.4f} ({n_realizations} realizations)")
\ No newline at end of file
@@ -1 +1,9 @@
-from .analysis_statistics import AnalysisStatistics
\ No newline at end of file
+from .._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "AnalysisStatistics": ".analysis_statistics"
+}
+
+__all__ = ["AnalysisStatistics"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
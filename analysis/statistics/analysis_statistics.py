@@ -8,12 +8,13 @@ class AnalysisStatistics:
     @staticmethod
     def estimate_amplitudes(samples, weights, n_slices, slice_size):
         """
-        Given a 2D array of data samples, a 1D array of weights, and the number of slices and slice size,
+        Given a 2D array of data samples, an array of weights, and the number of slices and slice size,
         estimate the amplitudes for each slice of the data using the given weights.
 
         Args:
             samples (numpy.ndarray): A 2D array of data samples.
-            weights (numpy.ndarray): A 1D array of weights used to estimate amplitudes.
+            weights (numpy.ndarray): A real-valued array of weights used to estimate amplitudes. It is
+                flattened before use, and must be real because np.correlate conjugates it.
             n_slices (int): The number of slices to take from the data.
             slice_size (int): The size of each slice.
 
@@ -21,15 +22,13 @@ class AnalysisStatistics:
             numpy.ndarray: A 1D array of estimated amplitudes for each slice.
         """
         n_estimates = (n_slices - 1) * slice_size + 1
-        amplitudes = np.zeros(n_estimates)
 
-        x = samples.flatten()
+        x = samples.flatten()[:n_slices * slice_size]
 
-        for i in range(n_estimates):
-            x_window = x[i : i + slice_size]
-            amplitudes[i] = np.sum(x_window * weights)
-        
-        return amplitudes
+        # Sliding dot product of every window x[i : i + slice_size] with the weights
+        amplitudes = np.correlate(x, np.ravel(weights), mode="valid")
+
+        return amplitudes[:n_estimates]
     
     @staticmethod
     def compare_amplitudes(test_amplitudes, n_slices, slice_size, estimated_amplitudes):
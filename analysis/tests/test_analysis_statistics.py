@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analysis.statistics.analysis_statistics import AnalysisStatistics
+
+def reference_estimate_amplitudes(samples, weights, n_slices, slice_size):
+    # The original window-by-window implementation
+    n_estimates = (n_slices - 1) * slice_size + 1
+    amplitudes = np.zeros(n_estimates)
+
+    x = samples.flatten()
+
+    for i in range(n_estimates):
+        x_window = x[i : i + slice_size]
+        amplitudes[i] = np.sum(x_window * weights)
+
+    return amplitudes
+
+@pytest.mark.parametrize("slice_size", [1, 3, 7, 11])
+def test_estimate_amplitudes_matches_reference_loop(slice_size):
+    n_slices = 50
+    rng = np.random.default_rng(slice_size)
+    samples = rng.normal(0.0, 1.5, (n_slices, slice_size))
+    weights = rng.uniform(-1.0, 1.0, slice_size)
+
+    estimated = AnalysisStatistics.estimate_amplitudes(samples, weights, n_slices, slice_size)
+    expected = reference_estimate_amplitudes(samples, weights, n_slices, slice_size)
+
+    assert estimated.shape == expected.shape == ((n_slices - 1) * slice_size + 1,)
+    np.testing.assert_allclose(estimated, expected, rtol=1e-12, atol=1e-12)
+
+def test_estimate_amplitudes_flattens_column_weights():
+    n_slices, slice_size = 20, 5
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0.0, 1.5, (n_slices, slice_size))
+    weights = rng.uniform(-1.0, 1.0, slice_size)
+
+    np.testing.assert_allclose(
+        AnalysisStatistics.estimate_amplitudes(samples, weights.reshape(-1, 1), n_slices, slice_size),
+        AnalysisStatistics.estimate_amplitudes(samples, weights, n_slices, slice_size))
\ No newline at end of file
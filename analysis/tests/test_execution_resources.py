@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from analysis.utils.execution_resources import ExecutionResources
+
+def test_default_split_uses_one_worker_per_core():
+    resources = ExecutionResources(n_cores=8)
+    assert (resources.n_workers, resources.blas_threads) == (8, 1)
+
+def test_blas_threads_derived_from_workers():
+    resources = ExecutionResources(n_workers=3, n_cores=8)
+    assert (resources.n_workers, resources.blas_threads) == (3, 2)
+
+def test_workers_derived_from_blas_threads():
+    resources = ExecutionResources(blas_threads=4, n_cores=8)
+    assert (resources.n_workers, resources.blas_threads) == (2, 4)
+
+def test_derived_values_leave_remaining_cores_idle():
+    resources = ExecutionResources(blas_threads=3, n_cores=8)
+    assert (resources.n_workers, resources.blas_threads) == (2, 3)
+
+def test_more_workers_than_cores_raises():
+    with pytest.raises(ValueError, match="oversubscribe"):
+        ExecutionResources(n_workers=16, n_cores=8)
+
+def test_oversubscription_raises():
+    with pytest.raises(ValueError, match="oversubscribe"):
+        ExecutionResources(n_workers=4, blas_threads=4, n_cores=8)
+
+@pytest.mark.parametrize("kwargs", [{"n_workers": 0}, {"blas_threads": 0}, {"n_cores": 0}])
+def test_non_positive_values_raise(kwargs):
+    with pytest.raises(ValueError, match="at least 1"):
+        ExecutionResources(**kwargs)
+
+def test_for_jobs_gives_idle_cores_to_blas():
+    resources = ExecutionResources(n_cores=8).for_jobs(1)
+    assert (resources.n_workers, resources.blas_threads) == (1, 8)
+
+    resources = ExecutionResources(n_cores=8).for_jobs(3)
+    assert (resources.n_workers, resources.blas_threads) == (3, 2)
+
+def test_for_jobs_keeps_explicit_blas_threads():
+    resources = ExecutionResources(n_workers=4, blas_threads=2, n_cores=8).for_jobs(1)
+    assert (resources.n_workers, resources.blas_threads) == (1, 2)
+
+def test_for_jobs_without_cap_returns_same_split():
+    resources = ExecutionResources(n_cores=4)
+    assert resources.for_jobs(10) is resources
+
+def test_candidate_splits():
+    assert ExecutionResources.candidate_splits(1) == [(1, 1)]
+    assert ExecutionResources.candidate_splits(6) == [(1, 6), (2, 3), (3, 2), (6, 1)]
+    assert ExecutionResources.candidate_splits(7) == [(1, 7), (7, 1)]
+
+@pytest.mark.parametrize("data_size", [11, 50, 120])
+def test_calibrate_rejects_too_few_slices(data_size):
+    with pytest.raises(ValueError, match="at least 11 slices"):
+        ExecutionResources.calibrate(11, data_size, n_cores=1)
+
+def test_calibrate_rejects_even_slice_size():
+    with pytest.raises(ValueError, match="odd"):
+        ExecutionResources.calibrate(4, 100, n_cores=1)
+
+def test_applied_restores_environment(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "7")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+
+    with ExecutionResources(1, 2, 2).applied():
+        assert os.environ["OMP_NUM_THREADS"] == "2"
+        assert os.environ["MKL_NUM_THREADS"] == "2"
+
+    assert os.environ["OMP_NUM_THREADS"] == "7"
+    assert "MKL_NUM_THREADS" not in os.environ
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The directory containing the analysis package
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def run_python(code):
+    """
+    Runs the given code in a fresh interpreter from the directory containing the package.
+    """
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                          capture_output=True, text=True)
+
+def test_import_analysis_loads_no_heavy_modules():
+    result = run_python("import analysis, sys; print('numpy' in sys.modules, 'pycps' in sys.modules)")
+    assert result.stdout.strip() == "False False"
+
+def test_cli_help_loads_no_heavy_modules():
+    # Running "python -m analysis --help" in-process, so sys.modules can be inspected afterwards
+    result = run_python("import runpy, sys\n"
+                        "sys.argv = ['analysis', '--help']\n"
+                        "try:\n"
+                        "    runpy.run_module('analysis', run_name='__main__', alter_sys=True)\n"
+                        "except SystemExit:\n"
+                        "    pass\n"
+                        "print('numpy' in sys.modules, 'pycps' in sys.modules, file=sys.stderr)")
+    assert result.stdout.startswith("usage:")
+    assert result.stderr.strip() == "False False"
+
+def test_setup_dataset_imports_without_pycps():
+    pytest.importorskip("numpy")
+
+    # A None entry in sys.modules makes any import of pycps fail
+    result = run_python("import sys; sys.modules['pycps'] = None\n"
+                        "from analysis.datasets.setup_dataset import SetupDataset\n"
+                        "print(SetupDataset.__name__)")
+    assert result.stdout.strip() == "SetupDataset"
+
+def test_dir_lists_lazy_names():
+    names = run_python("import analysis; print(' '.join(dir(analysis)))").stdout.split()
+
+    for name in ["AnalysisStatistics", "ArrayFileManager", "ExecutionResources", "Filter",
+                 "LS", "MonteCarloCases", "OF2", "SetupDataset", "StudyCases"]:
+        assert name in names
\ No newline at end of file
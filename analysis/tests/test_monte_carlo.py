@@ -0,0 +1,153 @@
+import os
+import sys
+import textwrap
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analysis.cases.monte_carlo import MonteCarloCases
+from analysis.runner import PULSE_SHAPE_PATH
+from analysis.utils.execution_resources import ExecutionResources
+
+# A deterministic stand-in for pycps, seeded through set_seed like the real generators
+STUB_PYCPS = textwrap.dedent("""
+    import numpy as np
+
+    class TextFilePulseShape:
+        def __init__(self, path):
+            self.path = path
+
+    class PulseGenerator:
+        UNIFORM_REAL_DISTRIBUTION = 0
+        UNIFORM_INT_DISTRIBUTION = 1
+
+        def __init__(self, pulse_shape):
+            self.rng = np.random.default_rng()
+
+        def set_amplitude_distribution(self, distribution, params):
+            self.amplitude_range = params
+
+        def set_phase_distribution(self, distribution, params):
+            pass
+
+        def set_deformation_level(self, level):
+            pass
+
+        def set_pedestal(self, pedestal):
+            pass
+
+        def set_seed(self, seed):
+            self.rng = np.random.default_rng(seed)
+
+    class SlicedDataset:
+        def __init__(self, time, samples, amplitudes):
+            self.time = time
+            self.samples = samples
+            self.amplitudes = amplitudes
+
+    class DatasetGenerator:
+        def __init__(self):
+            self.rng = np.random.default_rng()
+
+        def set_pulse_generator(self, pulse_generator):
+            self.pulse_generator = pulse_generator
+
+        def set_sampling_rate(self, rate):
+            self.rate = rate
+
+        def set_noise_params(self, mean, std):
+            self.noise_params = (mean, std)
+
+        def set_occupancy(self, occupancy):
+            self.occupancy = occupancy
+
+        def set_seed(self, seed):
+            self.rng = np.random.default_rng(seed)
+
+        def generate_sliced_dataset(self, n_slices, slice_size):
+            shape = (n_slices, slice_size)
+            pulses = self.pulse_generator.rng.uniform(*self.pulse_generator.amplitude_range, shape)
+            amplitudes = pulses * (self.rng.random(shape) < self.occupancy)
+            samples = amplitudes + self.rng.normal(*self.noise_params, shape)
+            time = np.arange(n_slices * slice_size).reshape(shape) * self.rate
+            return SlicedDataset(time.tolist(), samples.tolist(), amplitudes.tolist())
+""")
+
+@pytest.fixture
+def stub_pycps(tmp_path, monkeypatch):
+    # Written to a file on sys.path, so that spawned workers import the stub too
+    (tmp_path / "pycps.py").write_text(STUB_PYCPS)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "pycps", raising=False)
+    yield
+    sys.modules.pop("pycps", None)
+
+def make_cases(seed=1234):
+    return MonteCarloCases(PULSE_SHAPE_PATH, n_slices=60, slice_size=5, occupancy=0.1, seed=seed)
+
+def test_run_requires_training(stub_pycps):
+    with pytest.raises(RuntimeError, match="train"):
+        make_cases().run(2, ExecutionResources(1, 1, 1))
+
+def test_run_returns_one_row_per_realization(stub_pycps):
+    monte_carlo = make_cases()
+    weights = monte_carlo.train()
+    assert "LS" in weights
+
+    error_statistics = monte_carlo.run(4, ExecutionResources(1, 1, 1))
+
+    assert set(error_statistics) == set(weights)
+    for statistics in error_statistics.values():
+        assert statistics.shape == (4, 2)
+        assert np.all(statistics[:, 1] >= 0.0)
+
+def test_same_seed_gives_same_results_across_splits(stub_pycps):
+    serial = make_cases()
+    serial.train()
+    serial_statistics = serial.run(4, ExecutionResources(1, 1, 1))
+
+    parallel = make_cases()
+    parallel.train()
+    parallel_statistics = parallel.run(4, ExecutionResources(2, 1, 2))
+
+    assert set(serial_statistics) == set(parallel_statistics)
+    for name in serial_statistics:
+        np.testing.assert_array_equal(serial_statistics[name], parallel_statistics[name])
+
+def test_different_seeds_give_different_results(stub_pycps):
+    first, second = make_cases(1), make_cases(2)
+    first.train()
+    second.train()
+
+    assert not np.array_equal(first.run(2, ExecutionResources(1, 1, 1))["LS"],
+                              second.run(2, ExecutionResources(1, 1, 1))["LS"])
+
+def test_summarize():
+    error_statistics = {"LS": np.array([[1.0, 2.0], [3.0, 4.0]])}
+
+    summary = MonteCarloCases.summarize(error_statistics)
+
+    assert summary == {"LS": {"mean_error": (2.0, 1.0), "std_error": (3.0, 1.0)}}
+
+@pytest.mark.parametrize("n_realizations", [0, -1])
+def test_run_rejects_non_positive_realizations(n_realizations):
+    with pytest.raises(ValueError, match="at least 1 realization"):
+        make_cases().run(n_realizations, ExecutionResources(1, 1, 1))
+
+def test_rejects_fewer_slices_than_slice_size():
+    with pytest.raises(ValueError, match="at least the slice size"):
+        MonteCarloCases(PULSE_SHAPE_PATH, n_slices=3, slice_size=7, occupancy=0.1)
+
+def test_rejects_even_slice_size():
+    with pytest.raises(ValueError, match="odd"):
+        MonteCarloCases(PULSE_SHAPE_PATH, n_slices=60, slice_size=4, occupancy=0.1)
+
+def test_run_restores_blas_environment(stub_pycps, monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "7")
+    monte_carlo = make_cases()
+    monte_carlo.train()
+
+    monte_carlo.run(2, ExecutionResources(2, 1, 2))
+
+    assert os.environ["OMP_NUM_THREADS"] == "7"
\ No newline at end of file
@@ -1 +1,10 @@
-from .array_file_manager import ArrayFileManager
\ No newline at end of file
+from .._lazy import attach_lazy_attrs
+
+_LAZY_ATTRS = {
+    "ArrayFileManager": ".array_file_manager",
+    "ExecutionResources": ".execution_resources"
+}
+
+__all__ = ["ArrayFileManager", "ExecutionResources"]
+
+__getattr__, __dir__ = attach_lazy_attrs(__name__, _LAZY_ATTRS)
\ No newline at end of file
@@ -0,0 +1,253 @@
+import os
+import time
+import contextlib
+import multiprocessing as mp
+
+class ExecutionResources:
+    """
+    A class for splitting the available cores between process-level workers and BLAS threads per worker.
+
+    NumPy's BLAS backend reads its thread-pool size from the environment when it is first loaded,
+    so the limits must be applied before NumPy is imported in the processes doing the linear algebra.
+    Workers are started with the "spawn" method so that each one loads NumPy with the limits in place.
+
+    Usage example:
+
+    resources = ExecutionResources(n_workers=4)
+    with resources.applied(), resources.get_pool() as pool:
+        pool.starmap(calculate_results, jobs)
+
+    Attributes
+    ----------
+    n_cores : int
+        The number of cores available to the run.
+    n_workers : int
+        The number of worker processes.
+    blas_threads : int
+        The number of BLAS threads per worker process.
+
+    Methods
+    -------
+    apply()
+        Sets the BLAS thread limits in the environment of the current process and of the workers it starts.
+    applied()
+        Context manager that applies the BLAS thread limits and restores the previous environment on exit.
+    for_jobs(n_jobs)
+        Returns the split to use for the given number of jobs.
+    get_pool()
+        Returns a process pool with one process per worker.
+    candidate_splits(n_cores)
+        Returns every (n_workers, blas_threads) split that uses all the given cores.
+    calibrate(slice_size, data_size, n_cores, n_repeats)
+        Measures the throughput of every split and returns the fastest one.
+    """
+
+    BLAS_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+                     "BLIS_NUM_THREADS", "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+    def __init__(self, n_workers=None, blas_threads=None, n_cores=None):
+        """
+        Parameters
+        ----------
+        n_workers : int or None
+            The number of worker processes. If None, it is derived from the other parameters.
+        blas_threads : int or None
+            The number of BLAS threads per worker. If None, it is derived from the other parameters.
+        n_cores : int or None
+            The number of cores available to the run (default: all cores of the machine).
+
+        Raises
+        ------
+        ValueError
+            If any of the parameters is smaller than one, or if the split oversubscribes the cores.
+        """
+        self.n_cores = n_cores if n_cores is not None else (os.cpu_count() or 1)
+
+        for name, value in (("n_cores", self.n_cores), ("n_workers", n_workers), ("blas_threads", blas_threads)):
+            if value is not None and value < 1:
+                raise ValueError(f"Expected {name} to be at least 1, but got {value}")
+
+        blas_threads_set = blas_threads is not None
+
+        if n_workers is None and blas_threads is None:
+            # Small LS problems scale better across processes than across BLAS threads
+            n_workers, blas_threads = self.n_cores, 1
+        elif n_workers is None:
+            n_workers = max(1, self.n_cores // blas_threads)
+        elif blas_threads is None:
+            blas_threads = max(1, self.n_cores // n_workers)
+
+        if n_workers * blas_threads > self.n_cores:
+            raise ValueError(f"{n_workers} workers with {blas_threads} BLAS threads each "
+                             f"oversubscribe the {self.n_cores} available cores")
+
+        self.n_workers = n_workers
+        self.blas_threads = blas_threads
+        self._blas_threads_set = blas_threads_set
+
+    def __repr__(self):
+        return f"ExecutionResources(n_workers={self.n_workers}, blas_threads={self.blas_threads}, n_cores={self.n_cores})"
+
+    def for_jobs(self, n_jobs):
+        """
+        Returns the split to use for the given number of jobs.
+
+        The number of workers is capped at the number of jobs, and the cores left idle by the cap go
+        to the BLAS threads of each worker, unless the number of BLAS threads was set explicitly.
+
+        Parameters
+        ----------
+        n_jobs : int
+            The number of jobs to run.
+
+        Returns
+        -------
+        ExecutionResources
+            The split itself if no cap is needed, or a new capped split.
+        """
+        n_workers = max(1, min(self.n_workers, n_jobs))
+        if n_workers == self.n_workers:
+            return self
+
+        blas_threads = self.blas_threads if self._blas_threads_set else max(1, self.n_cores // n_workers)
+
+        return ExecutionResources(n_workers, blas_threads, self.n_cores)
+
+    def apply(self):
+        """
+        Sets the BLAS thread limits in the environment of the current process and of the workers it starts.
+
+        The limits only affect the current process if NumPy has not been imported yet.
+        """
+        for var in self.BLAS_ENV_VARS:
+            os.environ[var] = str(self.blas_threads)
+
+    @contextlib.contextmanager
+    def applied(self):
+        """
+        Context manager that applies the BLAS thread limits and restores the previous environment on exit.
+
+        Yields
+        ------
+        ExecutionResources
+            The split itself.
+        """
+        saved_env = {var: os.environ.get(var) for var in self.BLAS_ENV_VARS}
+        self.apply()
+        try:
+            yield self
+        finally:
+            for var, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = value
+
+    def get_pool(self):
+        """
+        Returns a process pool with one process per worker.
+
+        Returns
+        -------
+        multiprocessing.pool.Pool
+            A pool of freshly spawned processes, which load NumPy with the applied limits.
+        """
+        return mp.get_context("spawn").Pool(self.n_workers)
+
+    @staticmethod
+    def candidate_splits(n_cores):
+        """
+        Returns every (n_workers, blas_threads) split that uses all the given cores.
+
+        Parameters
+        ----------
+        n_cores : int
+            The number of cores to split.
+
+        Returns
+        -------
+        list of tuple
+            The splits, ordered by increasing number of workers.
+        """
+        return [(n_workers, n_cores // n_workers) for n_workers in range(1, n_cores + 1)
+                if n_cores % n_workers == 0]
+
+    @staticmethod
+    def calibrate(slice_size, data_size, n_cores=None, n_repeats=3):
+        """
+        Measures the throughput of every split and returns the fastest one.
+
+        Each split runs the same batch of jobs (one per core), where a job trains the LS filter
+        and estimates the amplitudes of a synthetic dataset of the given size.
+
+        Parameters
+        ----------
+        slice_size : int
+            The size of each slice.
+        data_size : int
+            The number of samples of each synthetic dataset.
+        n_cores : int or None
+            The number of cores available to the run (default: all cores of the machine).
+        n_repeats : int
+            The number of timed repetitions per split; the fastest one is kept.
+
+        Returns
+        -------
+        Tuple[ExecutionResources, dict]
+            The fastest split and the elapsed time in seconds of every (n_workers, blas_threads) split.
+
+        Raises
+        ------
+        ValueError
+            If the slice size is not an odd number, or the data size holds fewer slices than the
+            slice size (the LS problem would be rank deficient).
+        """
+        if slice_size % 2 == 0:
+            raise ValueError("Slice size must be an odd number.")
+        if data_size // slice_size < slice_size:
+            raise ValueError(f"Data size must hold at least {slice_size} slices of size {slice_size} "
+                             f"(at least {slice_size * slice_size} samples), but got {data_size}")
+
+        n_cores = n_cores if n_cores is not None else (os.cpu_count() or 1)
+        jobs = [(slice_size, data_size, seed) for seed in range(n_cores)]
+
+        timings = {}
+        for n_workers, blas_threads in ExecutionResources.candidate_splits(n_cores):
+            resources = ExecutionResources(n_workers, blas_threads, n_cores)
+            with resources.applied(), resources.get_pool() as pool:
+                # The first repetition also pays for the NumPy import in each worker
+                elapsed = []
+                for _ in range(n_repeats + 1):
+                    start = time.perf_counter()
+                    pool.starmap(_calibration_job, jobs, chunksize=1)
+                    elapsed.append(time.perf_counter() - start)
+            timings[(n_workers, blas_threads)] = min(elapsed[1:])
+
+        n_workers, blas_threads = min(timings, key=timings.get)
+
+        return (ExecutionResources(n_workers, blas_threads, n_cores), timings)
+
+def _calibration_job(slice_size, data_size, seed):
+    """
+    Trains the LS filter and estimates the amplitudes of a synthetic dataset.
+
+    Parameters
+    ----------
+    slice_size : int
+        The size of each slice.
+    data_size : int
+        The number of samples of the synthetic dataset.
+    seed : int
+        The seed of the random number generator.
+    """
+    import numpy as np
+    from ..filters.least_squares import LS
+    from ..statistics.analysis_statistics import AnalysisStatistics
+
+    n_slices = data_size // slice_size
+    rng = np.random.default_rng(seed)
+    samples = rng.normal(0.0, 1.5, (n_slices, slice_size))
+    amplitudes = samples[:, slice_size // 2]
+
+    weights, _ = LS(samples, amplitudes, slice_size).go_filtering()
+    AnalysisStatistics.estimate_amplitudes(samples, weights, n_slices, slice_size)